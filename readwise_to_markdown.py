@@ -8,21 +8,42 @@ into folders by reading status.
 
 Usage:
     export READWISE_TOKEN="your_token_here"
-    python3 readwise_to_markdown.py [--output-dir ./output]
+    python3 readwise_to_markdown.py [--output-dir ./output] [--dump-json]
 
 Get your token at: https://readwise.io/access_token
+
+If orjson is installed it is used for faster JSON parsing and dumping.
 """
 
 import os
 import sys
 import json
 import argparse
+import base64
 import re
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import contextmanager
+from dataclasses import dataclass
 from datetime import datetime, timezone
+from http.client import HTTPSConnection, HTTPException
 from pathlib import Path
-from urllib.request import Request, urlopen
-from urllib.parse import urlencode
-from urllib.error import HTTPError
+from urllib.parse import unquote, urlencode, urlsplit
+from urllib.request import getproxies, proxy_bypass
+
+try:
+    import orjson
+
+    json_loads = orjson.loads
+
+    def json_dumps(obj):
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2, default=str)
+except ImportError:
+    json_loads = json.loads
+
+    def json_dumps(obj):
+        # Raw UTF-8 like orjson, rather than \uXXXX escapes for non-ASCII text
+        return json.dumps(obj, indent=2, default=str, ensure_ascii=False).encode()
 
 
 API_BASE = "https://readwise.io/api/v3"
@@ -31,6 +52,36 @@ LOCATIONS = {
     "archive": ["archive"],
     "feed": ["feed"],
 }
+LOC_TO_SECTION = {loc: section for section, locs in LOCATIONS.items() for loc in locs}
+SECTION_EMOJI = {"queue": "📋", "archive": "✅", "feed": "📡"}
+# location -> (status emoji, section folder); unknown locations are shown as feed
+LOC_STATUS = {loc: (SECTION_EMOJI[section], section) for loc, section in LOC_TO_SECTION.items()}
+MAX_RETRIES = 5
+HIGHLIGHT_WORKERS = 8
+WRITE_WORKERS = 16
+REQUEST_TIMEOUT = 60
+
+# One keep-alive connection per worker thread, reused across requests
+_API_URL = urlsplit(API_BASE)
+_local = threading.local()
+
+# slugify: drop anything that isn't a word char, whitespace or dash, then
+# collapse runs of whitespace/underscores/dashes into a single dash
+_SLUG_STRIP = re.compile(r'[^\w\s-]')
+_SLUG_DASH = re.compile(r'[-\s_]+')
+# Same stripping as _SLUG_STRIP for pure-ASCII titles, in one C-level pass
+_SLUG_ASCII_STRIP = str.maketrans("", "", "".join(
+    c for c in map(chr, range(128)) if not (c.isalnum() or c.isspace() or c in "_-")
+))
+
+# Set once any request fails for good, so requests on other worker threads
+# stop instead of running to completion; _failures holds the errors behind it
+_abort = threading.Event()
+_failures = []
+
+
+class APIError(Exception):
+    """A Readwise API request failed and will not be retried."""
 
 
 def get_token():
@@ -42,22 +93,96 @@ def get_token():
     return token
 
 
+def retry_delay(headers, attempt):
+    """Seconds to wait before retrying, honouring Retry-After if present."""
+    retry_after = headers.get("Retry-After") if headers else None
+    if retry_after:
+        try:
+            return max(float(retry_after), 0)
+        except ValueError:
+            pass
+    return 2 ** attempt
+
+
+@contextmanager
+def cancel_on_failure(futures):
+    """If the block raises, stop in-flight requests and cancel queued futures.
+
+    Without this, leaving the executor's with-block would wait for every
+    queued request to run. futures may still be growing while the block runs.
+    """
+    try:
+        yield
+    except BaseException:
+        _abort.set()
+        for future in futures:
+            future.cancel()
+        raise
+
+
+def get_connection():
+    """Return this thread's persistent connection to the Readwise API.
+
+    Honours HTTPS_PROXY/NO_PROXY like urlopen does, tunnelling through the
+    proxy with CONNECT.
+    """
+    conn = getattr(_local, "conn", None)
+    if conn is None:
+        proxy = getproxies().get("https")
+        if proxy and not proxy_bypass(_API_URL.hostname):
+            proxy_url = urlsplit(proxy if "://" in proxy else f"http://{proxy}")
+            conn = HTTPSConnection(proxy_url.hostname, proxy_url.port or 80, timeout=REQUEST_TIMEOUT)
+            headers = {}
+            if proxy_url.username:
+                creds = f"{unquote(proxy_url.username)}:{unquote(proxy_url.password or '')}"
+                headers["Proxy-Authorization"] = "Basic " + base64.b64encode(creds.encode()).decode()
+            conn.set_tunnel(_API_URL.netloc, headers=headers)
+        else:
+            conn = HTTPSConnection(_API_URL.netloc, timeout=REQUEST_TIMEOUT)
+        _local.conn = conn
+    return conn
+
+
 def api_request(endpoint, token, params=None):
-    """Make a GET request to the Readwise API."""
-    url = f"{API_BASE}/{endpoint}/"
+    """Make a GET request to the Readwise API, retrying on 429/5xx."""
+    path = f"{_API_URL.path}/{endpoint}/"
     if params:
-        url += "?" + urlencode(params, doseq=True)
-    req = Request(url, headers={"Authorization": f"Token {token}"})
-    try:
-        with urlopen(req) as resp:
-            return json.loads(resp.read().decode())
-    except HTTPError as e:
-        print(f"API error {e.code}: {e.read().decode()}")
-        sys.exit(1)
+        path += "?" + urlencode(params, doseq=True)
+    headers = {"Authorization": f"Token {token}"}
+    for attempt in range(MAX_RETRIES + 1):
+        if _abort.is_set():
+            raise APIError("Aborted: another API request failed")
+        conn = get_connection()
+        try:
+            conn.request("GET", path, headers=headers)
+            resp = conn.getresponse()
+            body = resp.read()
+        except (HTTPException, OSError):
+            # Stale keep-alive or network hiccup: reconnect on the next attempt
+            conn.close()
+            if attempt == MAX_RETRIES:
+                raise
+            if attempt:
+                _abort.wait(retry_delay(None, attempt))
+            continue
+        if 200 <= resp.status < 300:
+            return json_loads(body)
+        if attempt < MAX_RETRIES and (resp.status == 429 or resp.status >= 500):
+            _abort.wait(retry_delay(resp.headers, attempt))
+            continue
+        error = APIError(f"API error {resp.status}: {body.decode()}")
+        _failures.append(error)
+        _abort.set()
+        raise error
+
 
+def fetch_all_documents(token, location=None, category=None, on_page=None):
+    """Fetch all documents, handling pagination.
 
-def fetch_all_documents(token, location=None, category=None):
-    """Fetch all documents, handling pagination."""
+    If given, on_page is called with each page of results as soon as it
+    arrives, so callers can start follow-up requests while the next page
+    is still being fetched.
+    """
     documents = []
     params = {}
     if location:
@@ -70,11 +195,14 @@ def fetch_all_documents(token, location=None, category=None):
         if cursor:
             params["pageCursor"] = cursor
         data = api_request("list", token, params)
-        documents.extend(data.get("results", []))
+        results = data.get("results", [])
+        documents.extend(results)
+        if on_page:
+            on_page(results)
         cursor = data.get("nextPageCursor")
         if not cursor:
             break
-        print(f"  Fetched {len(documents)} documents so far...")
+        print(f"  Fetched {len(documents)} '{location}' documents so far...")
 
     return documents
 
@@ -86,12 +214,26 @@ def fetch_highlights(token, doc_id):
     return data.get("results", [])
 
 
+def collect_highlights(requests):
+    """Attach highlights to docs from (doc, future) pairs.
+
+    Futures are consumed in completion order so a failure surfaces at once.
+    """
+    by_future = {future: doc for doc, future in requests}
+    for i, future in enumerate(as_completed(by_future), 1):
+        by_future[future]["_highlights"] = future.result()
+        if i % 10 == 0:
+            print(f"  Processed {i}/{len(requests)}")
+
+
 def slugify(text, max_len=80):
     """Create a filesystem-safe slug from text."""
-    text = text.lower().strip()
-    text = re.sub(r'[^\w\s-]', '', text)
-    text = re.sub(r'[\s_]+', '-', text)
-    text = re.sub(r'-+', '-', text).strip('-')
+    text = text.lower()
+    if text.isascii():
+        text = text.translate(_SLUG_ASCII_STRIP)
+    else:
+        text = _SLUG_STRIP.sub('', text)
+    text = _SLUG_DASH.sub('-', text).strip('-')
     return text[:max_len] if text else "untitled"
 
 
@@ -116,179 +258,238 @@ def yaml_escape(val):
     return val
 
 
-def document_to_file(doc):
-    """Convert a single document to a markdown string with YAML frontmatter."""
-    title = doc.get("title", "Untitled") or "Untitled"
-    author = doc.get("author") or ""
-    source_url = doc.get("source_url", "") or ""
-    reader_url = doc.get("url", "") or ""
-    category = doc.get("category", "article")
-    location = doc.get("location", "")
-    word_count = doc.get("word_count") or 0
-    reading_time = doc.get("reading_time") or ""
-    reading_progress = doc.get("reading_progress") or 0
-    summary = doc.get("summary") or ""
-    tags = doc.get("tags", {})
-    saved_at = format_date(doc.get("saved_at"))
-    published = format_date(doc.get("published_date"))
-    site_name = doc.get("site_name") or ""
-    notes = doc.get("notes") or ""
-    doc_id = doc.get("id", "")
-
-    tag_list = sorted(tags.keys()) if isinstance(tags, dict) else (tags or [])
+def shorten(text, width):
+    """Truncate text to width characters, marking the cut with '...'."""
+    return text if len(text) <= width else text[:width] + "..."
+
+
+@dataclass
+class Document:
+    """A Reader document with defaults and derived fields resolved once.
+
+    The raw API dict is left untouched for the JSON backup.
+    """
+    # Declared by hand so the class still works on Python < 3.10,
+    # which lacks @dataclass(slots=True)
+    __slots__ = (
+        "id", "title", "slug", "author", "source_url", "reader_url", "site_name",
+        "category", "location", "word_count", "reading_time", "reading_progress",
+        "summary", "notes", "tags", "saved_at", "saved", "published", "highlights",
+    )
+
+    id: str
+    title: str
+    slug: str
+    author: str
+    source_url: str
+    reader_url: str
+    site_name: str
+    category: str
+    location: str
+    word_count: int
+    reading_time: str
+    reading_progress: float
+    summary: str
+    notes: str
+    tags: list
+    saved_at: str
+    saved: str
+    published: str
+    highlights: list
+
+    @classmethod
+    def from_api(cls, doc):
+        """Build a Document from a raw API document."""
+        get = doc.get
+        title = get("title") or "Untitled"
+        tags = get("tags")
+        return cls(
+            id=get("id") or "",
+            title=title,
+            slug=slugify(title),
+            author=get("author") or "",
+            source_url=get("source_url") or "",
+            reader_url=get("url") or "",
+            site_name=get("site_name") or "",
+            category=get("category") or "article",
+            location=get("location") or "",
+            word_count=get("word_count") or 0,
+            reading_time=get("reading_time") or "",
+            reading_progress=get("reading_progress") or 0,
+            summary=get("summary") or "",
+            notes=get("notes") or "",
+            tags=sorted(tags.keys()) if isinstance(tags, dict) else (tags or []),
+            saved_at=get("saved_at") or "",
+            saved=format_date(get("saved_at")) or "",
+            published=format_date(get("published_date")) or "",
+            highlights=get("_highlights") or [],
+        )
+
+
+def write_document(out, doc):
+    """Write a single Document as markdown with YAML frontmatter to out."""
+    write = out.write
+    title = doc.title
+    author = doc.author
+    source_url = doc.source_url
+    site_name = doc.site_name
+    saved = doc.saved
+    published = doc.published
+    tag_list = doc.tags
 
     # YAML frontmatter
-    lines = ["---"]
-    lines.append(f"id: {yaml_escape(doc_id)}")
-    lines.append(f"title: {yaml_escape(title)}")
-    lines.append(f"author: {yaml_escape(author)}")
-    lines.append(f"url: {yaml_escape(source_url)}")
-    lines.append(f"reader_url: {yaml_escape(reader_url)}")
-    lines.append(f"site: {yaml_escape(site_name)}")
-    lines.append(f"category: {category}")
-    lines.append(f"location: {location}")
-    lines.append(f"word_count: {word_count}")
-    lines.append(f"reading_time: {yaml_escape(reading_time)}")
-    lines.append(f"reading_progress: {reading_progress}")
-    if saved_at:
-        lines.append(f"saved_at: {saved_at}")
+    write(
+        f"---\n"
+        f"id: {yaml_escape(doc.id)}\n"
+        f"title: {yaml_escape(title)}\n"
+        f"author: {yaml_escape(author)}\n"
+        f"url: {yaml_escape(source_url)}\n"
+        f"reader_url: {yaml_escape(doc.reader_url)}\n"
+        f"site: {yaml_escape(site_name)}\n"
+        f"category: {doc.category}\n"
+        f"location: {doc.location}\n"
+        f"word_count: {doc.word_count}\n"
+        f"reading_time: {yaml_escape(doc.reading_time)}\n"
+        f"reading_progress: {doc.reading_progress}\n"
+    )
+    if saved:
+        write(f"saved_at: {saved}\n")
     if published:
-        lines.append(f"published: {published}")
-    if tag_list:
-        lines.append(f"tags: [{', '.join(yaml_escape(t) for t in tag_list)}]")
-    else:
-        lines.append("tags: []")
-    lines.append("---")
-    lines.append("")
+        write(f"published: {published}\n")
+    tags = ", ".join(yaml_escape(t) for t in tag_list)
 
-    # Title
-    lines.append(f"# {title}")
-    lines.append("")
+    # Closing frontmatter and title
+    write(f"tags: [{tags}]\n---\n\n# {title}\n")
 
-    # Metadata
+    # Metadata (each block below writes its own leading blank line)
     meta = []
     if author:
         meta.append(f"**{author}**")
     if site_name:
         meta.append(f"_{site_name}_")
     if meta:
-        lines.append(" · ".join(meta))
-        lines.append("")
+        write(f"\n{' · '.join(meta)}\n")
 
     if source_url:
-        lines.append(f"🔗 [{source_url[:80]}{'...' if len(source_url) > 80 else ''}]({source_url})")
-        lines.append("")
+        write(f"\n🔗 [{shorten(source_url, 80)}]({source_url})\n")
 
     # Summary
+    summary = doc.summary
     if summary:
-        lines.append("## Summary")
-        lines.append("")
-        lines.append(f"> {summary}")
-        lines.append("")
+        write(f"\n## Summary\n\n> {summary}\n")
 
     # Notes
+    notes = doc.notes
     if notes:
-        lines.append("## Notes")
-        lines.append("")
-        lines.append(notes)
-        lines.append("")
+        write(f"\n## Notes\n\n{notes}\n")
 
     # Highlights
-    highlights = doc.get("_highlights", [])
+    highlights = doc.highlights
     if highlights:
-        lines.append("## Highlights")
-        lines.append("")
+        write("\n## Highlights\n")
         for h in highlights:
             text = h.get("content", h.get("title", ""))
             if text:
-                lines.append(f"> {text}")
+                write(f"\n> {text}\n")
                 h_notes = h.get("notes", "")
                 if h_notes:
-                    lines.append(f">\n> — _{h_notes}_")
-                lines.append("")
+                    write(f">\n> — _{h_notes}_\n")
+
+
+def bucket_by_section(docs):
+    """Split documents into section lists in a single pass."""
+    buckets = {section: [] for section in LOCATIONS}
+    appenders = {loc: buckets[section].append for loc, section in LOC_TO_SECTION.items()}
+    for d in docs:
+        append = appenders.get(d.location)
+        if append:
+            append(d)
+    return buckets
+
+
+def write_document_file(path, doc):
+    """Write a single Document to its own markdown file."""
+    with open(path, "w", encoding="utf-8") as f:
+        write_document(f, doc)
+
 
-    return "\n".join(lines)
+_INDEX_ROW = "| {status} | [{title}]({section}/{slug}.md) | {author} | {category} | {words:,} | {progress} |\n".format
 
 
-def generate_index(all_docs, output_dir):
-    """Generate a top-level README index."""
-    queue = [d for d in all_docs if d.get("location") in LOCATIONS["queue"]]
-    archive = [d for d in all_docs if d.get("location") in LOCATIONS["archive"]]
-    feed = [d for d in all_docs if d.get("location") in LOCATIONS["feed"]]
+def write_index(out, all_docs, buckets):
+    """Write the top-level README index to out."""
+    write = out.write
+    queue = buckets["queue"]
+    archive = buckets["archive"]
+    feed = buckets["feed"]
 
-    total_words = sum(d.get("word_count", 0) or 0 for d in all_docs)
+    total_words = sum(d.word_count for d in all_docs)
     categories = {}
+    get_count = categories.get
     for d in all_docs:
-        cat = d.get("category", "other")
-        categories[cat] = categories.get(cat, 0) + 1
-
-    lines = []
-    lines.append("# 📚 Readwise Reader Library")
-    lines.append("")
-    lines.append(f"_Last updated: {datetime.now().strftime('%Y-%m-%d %H:%M')}_")
-    lines.append("")
-    lines.append("## Sections")
-    lines.append("")
-    lines.append(f"- [`queue/`](queue/) — 📋 Reading Queue ({len(queue)} items)")
-    lines.append(f"- [`archive/`](archive/) — ✅ Archive ({len(archive)} items)")
+        cat = d.category
+        categories[cat] = get_count(cat, 0) + 1
+
+    write(
+        f"# 📚 Readwise Reader Library\n"
+        f"\n"
+        f"_Last updated: {datetime.now().strftime('%Y-%m-%d %H:%M')}_\n"
+        f"\n"
+        f"## Sections\n"
+        f"\n"
+        f"- [`queue/`](queue/) — 📋 Reading Queue ({len(queue)} items)\n"
+        f"- [`archive/`](archive/) — ✅ Archive ({len(archive)} items)\n"
+    )
     if feed:
-        lines.append(f"- [`feed/`](feed/) — 📡 Feed ({len(feed)} items)")
-    lines.append("")
-    lines.append("## Stats")
-    lines.append("")
-    lines.append(f"- **Total items:** {len(all_docs)}")
-    lines.append(f"- **Total words:** {total_words:,}")
-    lines.append(f"- **Categories:** {', '.join(f'{k} ({v})' for k, v in sorted(categories.items(), key=lambda x: -x[1]))}")
-    lines.append("")
-
-    # Table of all items
-    lines.append("## All Items")
-    lines.append("")
-    lines.append("| Status | Title | Author | Category | Words | Progress |")
-    lines.append("|--------|-------|--------|----------|-------|----------|")
-    for doc in sorted(all_docs, key=lambda d: d.get("saved_at", ""), reverse=True):
-        title = doc.get("title", "Untitled") or "Untitled"
-        short_title = title[:50] + "..." if len(title) > 50 else title
-        author = doc.get("author", "") or ""
-        short_author = author[:20] + "..." if len(author) > 20 else author
-        cat = doc.get("category", "")
-        wc = doc.get("word_count") or 0
-        loc = doc.get("location", "")
-        progress = doc.get("reading_progress") or 0
-        pct = f"{int(progress * 100)}%" if progress else "-"
-
-        # Link to individual file
-        section = "queue" if loc in LOCATIONS["queue"] else ("archive" if loc in LOCATIONS["archive"] else "feed")
-        slug = slugify(title)
-        link = f"[{short_title}]({section}/{slug}.md)"
-
-        status = "📋" if loc in LOCATIONS["queue"] else ("✅" if loc in LOCATIONS["archive"] else "📡")
-        lines.append(f"| {status} | {link} | {short_author} | {cat} | {wc:,} | {pct} |")
-
-    lines.append("")
-    return "\n".join(lines)
-
-
-def generate_section_index(docs, title, emoji, folder_name, description=""):
-    """Generate an index for a section folder."""
-    lines = []
-    lines.append(f"# {emoji} {title}")
-    lines.append("")
+        write(f"- [`feed/`](feed/) — 📡 Feed ({len(feed)} items)\n")
+    category_counts = ", ".join(f"{k} ({v})" for k, v in sorted(categories.items(), key=lambda x: -x[1]))
+    write(
+        f"\n"
+        f"## Stats\n"
+        f"\n"
+        f"- **Total items:** {len(all_docs)}\n"
+        f"- **Total words:** {total_words:,}\n"
+        f"- **Categories:** {category_counts}\n"
+        f"\n"
+        # Table of all items
+        f"## All Items\n"
+        f"\n"
+        f"| Status | Title | Author | Category | Words | Progress |\n"
+        f"|--------|-------|--------|----------|-------|----------|\n"
+    )
+    feed_status = LOC_STATUS["feed"]
+    for doc in sorted(all_docs, key=lambda d: d.saved_at, reverse=True):
+        status, section = LOC_STATUS.get(doc.location, feed_status)
+        progress = doc.reading_progress
+        write(_INDEX_ROW(
+            status=status,
+            title=shorten(doc.title, 50),
+            section=section,
+            slug=doc.slug,
+            author=shorten(doc.author, 20),
+            category=doc.category,
+            words=doc.word_count,
+            progress=f"{int(progress * 100)}%" if progress else "-",
+        ))
+
+
+def write_section_index(out, docs, title, emoji, folder_name, description=""):
+    """Write the index for a section folder to out."""
+    write = out.write
+    write(f"# {emoji} {title}\n\n")
     if description:
-        lines.append(f"_{description}_")
-        lines.append("")
-    lines.append(f"**{len(docs)} items**")
-    lines.append("")
+        write(f"_{description}_\n\n")
+    write(f"**{len(docs)} items**\n")
 
     if not docs:
-        lines.append("_Nothing here yet!_")
-        return "\n".join(lines)
+        write("\n_Nothing here yet!_\n")
+        return
 
     # Group by category
     by_category = {}
+    group = by_category.setdefault
     for doc in docs:
-        cat = doc.get("category", "article")
-        by_category.setdefault(cat, []).append(doc)
+        group(doc.category, []).append(doc)
 
     cat_emojis = {
         "article": "📄", "email": "📧", "rss": "📡", "pdf": "📑",
@@ -297,19 +498,11 @@ def generate_section_index(docs, title, emoji, folder_name, description=""):
 
     for cat in sorted(by_category.keys()):
         cat_docs = by_category[cat]
-        cat_docs.sort(key=lambda d: d.get("saved_at", ""), reverse=True)
+        cat_docs.sort(key=lambda d: d.saved_at, reverse=True)
         emoji_cat = cat_emojis.get(cat, "📄")
-        lines.append(f"## {emoji_cat} {cat.title()} ({len(cat_docs)})")
-        lines.append("")
+        write(f"\n## {emoji_cat} {cat.title()} ({len(cat_docs)})\n\n")
         for doc in cat_docs:
-            title = doc.get("title", "Untitled") or "Untitled"
-            slug = slugify(title)
-            author = doc.get("author", "") or ""
-            saved = format_date(doc.get("saved_at")) or ""
-            lines.append(f"- [{title}]({slug}.md) — {author} ({saved})")
-        lines.append("")
-
-    return "\n".join(lines)
+            write(f"- [{doc.title}]({doc.slug}.md) — {doc.author} ({doc.saved})\n")
 
 
 def main():
@@ -330,6 +523,11 @@ def main():
         default=None,
         help="Filter by categories (e.g., article pdf epub)"
     )
+    parser.add_argument(
+        "--dump-json",
+        action="store_true",
+        help="Also write the raw API data to data.json (skipped by default; can be large)"
+    )
     args = parser.parse_args()
 
     token = get_token()
@@ -338,95 +536,138 @@ def main():
     print("🔄 Fetching documents from Readwise Reader...")
     all_docs = []
 
-    for section, locations in LOCATIONS.items():
-        for loc in locations:
-            print(f"  📥 Fetching '{loc}' documents...")
-            docs = fetch_all_documents(token, location=loc)
-            if args.categories:
-                docs = [d for d in docs if d.get("category") in args.categories]
-            docs = [d for d in docs if d.get("parent_id") is None]
-            all_docs.extend(docs)
-            print(f"    Found {len(docs)} items")
-
-    print(f"\n📊 Total: {len(all_docs)} documents")
-
-    # Optionally fetch highlights
+    def wanted(doc):
+        if args.categories and doc.get("category") not in args.categories:
+            return False
+        return doc.get("parent_id") is None
+
+    # Highlight requests are queued page by page as documents arrive, so
+    # they overlap with the remaining pagination. They are kept as (doc,
+    # future) pairs, not keyed by id: a document moved between locations
+    # mid-export can be listed under both.
+    highlight_requests = []
+    queued = []  # every submitted future, so a failure can cancel the rest
+    on_page = None
+    highlight_executor = ThreadPoolExecutor(max_workers=HIGHLIGHT_WORKERS)
     if args.with_highlights:
-        print("\n💡 Fetching highlights...")
-        for i, doc in enumerate(all_docs):
-            highlights = fetch_highlights(token, doc["id"])
-            doc["_highlights"] = highlights
-            if (i + 1) % 10 == 0:
-                print(f"  Processed {i + 1}/{len(all_docs)}")
+        def on_page(page):
+            for doc in page:
+                if wanted(doc):
+                    future = highlight_executor.submit(fetch_highlights, token, doc["id"])
+                    highlight_requests.append((doc, future))
+                    queued.append(future)
+
+    # Locations paginate independently, so fetch them concurrently
+    all_locations = [loc for locations in LOCATIONS.values() for loc in locations]
+    try:
+        # cancel_on_failure exits first, so nothing queued runs after an error
+        with highlight_executor, ThreadPoolExecutor(max_workers=len(all_locations)) as executor, \
+                cancel_on_failure(queued):
+            futures = {}
+            for loc in all_locations:
+                print(f"  📥 Fetching '{loc}' documents...")
+                future = executor.submit(fetch_all_documents, token, location=loc, on_page=on_page)
+                futures[future] = loc
+                queued.append(future)
+
+            # Collect in completion order so the first failure surfaces at once
+            fetched = {}
+            for future in as_completed(futures):
+                fetched[futures[future]] = future.result()
+
+            for loc in all_locations:
+                docs = [d for d in fetched[loc] if wanted(d)]
+                all_docs.extend(docs)
+                print(f"    Found {len(docs)} '{loc}' items")
+
+            print(f"\n📊 Total: {len(all_docs)} documents")
+
+            # Optionally fetch highlights
+            if args.with_highlights:
+                print("\n💡 Fetching highlights...")
+                collect_highlights(highlight_requests)
+    except APIError as e:
+        # Report the request that failed, not one that was aborted because of it
+        print(_failures[0] if _failures else e)
+        sys.exit(1)
+
+    # Defaults, slugs and dates are needed by several outputs; resolve them once
+    records = [Document.from_api(d) for d in all_docs]
 
     # Create folder structure
     print("\n📝 Generating markdown files...")
 
+    buckets = bucket_by_section(records)
+
     sections = {
         "queue": {
-            "docs": [d for d in all_docs if d.get("location") in LOCATIONS["queue"]],
+            "docs": buckets["queue"],
             "title": "Reading Queue",
             "emoji": "📋",
             "desc": "Articles and documents waiting to be read.",
         },
         "archive": {
-            "docs": [d for d in all_docs if d.get("location") in LOCATIONS["archive"]],
+            "docs": buckets["archive"],
             "title": "Archive",
             "emoji": "✅",
             "desc": "Finished reading or archived for reference.",
         },
         "feed": {
-            "docs": [d for d in all_docs if d.get("location") in LOCATIONS["feed"]],
+            "docs": buckets["feed"],
             "title": "Feed",
             "emoji": "📡",
             "desc": "Items from RSS feeds and subscriptions.",
         },
     }
 
-    # Track slugs to handle duplicates
-    used_slugs = {}
-
-    for section_name, section in sections.items():
-        docs = section["docs"]
-        if not docs:
-            continue
-
-        section_dir = output_dir / section_name
-        section_dir.mkdir(parents=True, exist_ok=True)
-
-        # Write individual files
-        for doc in docs:
-            title = doc.get("title", "Untitled") or "Untitled"
-            slug = slugify(title)
-
-            # Handle duplicate slugs
-            key = f"{section_name}/{slug}"
-            if key in used_slugs:
-                used_slugs[key] += 1
-                slug = f"{slug}-{used_slugs[key]}"
-            else:
-                used_slugs[key] = 0
-
-            filepath = section_dir / f"{slug}.md"
-            filepath.write_text(document_to_file(doc))
-
-        # Section index
-        index_md = generate_section_index(
-            docs, section["title"], section["emoji"], section_name, section["desc"]
-        )
-        (section_dir / "README.md").write_text(index_md)
-        print(f"  ✅ {section_name}/ ({len(docs)} files)")
+    with ThreadPoolExecutor(max_workers=WRITE_WORKERS) as executor:
+        for section_name, section in sections.items():
+            docs = section["docs"]
+            if not docs:
+                continue
+
+            section_dir = output_dir / section_name
+            section_dir.mkdir(parents=True, exist_ok=True)
+
+            paths = []
+            add_path = paths.append
+            taken = set()  # slugs already used in this section
+            for doc in docs:
+                base = slug = doc.slug
+
+                # Handle duplicate slugs
+                i = 1
+                while slug in taken:
+                    slug = f"{base}-{i}"
+                    i += 1
+                taken.add(slug)
+
+                doc.slug = slug
+                add_path(section_dir / f"{slug}.md")
+
+            # Write individual files in parallel; they are independent
+            written = executor.map(write_document_file, paths, docs)
+
+            # Section index, on the main thread while the files are written
+            with open(section_dir / "README.md", "w", encoding="utf-8") as f:
+                write_section_index(
+                    f, docs, section["title"], section["emoji"], section_name, section["desc"]
+                )
+            list(written)  # wait for the section's files and re-raise any error
+            print(f"  ✅ {section_name}/ ({len(docs)} files)")
 
     # Top-level index
-    index_md = generate_index(all_docs, output_dir)
-    (output_dir / "README.md").write_text(index_md)
+    with open(output_dir / "README.md", "w", encoding="utf-8") as f:
+        write_index(f, records, buckets)
     print(f"  ✅ README.md (index)")
 
     # Raw JSON backup
-    json_path = output_dir / "data.json"
-    with open(json_path, "w") as f:
-        json.dump(all_docs, f, indent=2, default=str)
-    print(f"  ✅ data.json (raw data backup)")
+    if args.dump_json:
+        json_path = output_dir / "data.json"
+        # Serialized up front so the whole backup goes out in one large write
+        with open(json_path, "wb") as f:
+            f.write(json_dumps(all_docs))
+        print(f"  ✅ data.json (raw data backup)")
 
     print(f"\n🎉 Done! Output in: {output_dir.resolve()}")
     print(f"   {sum(len(s['docs']) for s in sections.values())} individual markdown files generated.")